@@ -2,83 +2,130 @@
 
 import inspect
 from functools import wraps
-from typing import Callable, Any
+from types import MappingProxyType
+from typing import Callable, Any, Optional, get_type_hints
 
 from .schemas import LifecycleConfig
-from .utils import validate_config, inject_headers, get_endpoint_configs
+from .utils import (
+    validate_config,
+    build_header_injector,
+    build_raw_headers,
+    store_endpoint_config,
+    get_endpoint_injector,
+)
 
 
-def _create_lifecycle_decorator(config_attr: str):
+# Number of lifecycle decorator applications, so the middleware can skip all
+# work while no endpoint carries lifecycle metadata
+_DECORATED_COUNT = 0
+
+
+def _create_lifecycle_decorator(config_type: str):
     """
     Factory function to create lifecycle decorators.
 
+    The decorators render their headers when applied: dates are formatted and
+    other values are converted with ``str()`` once, never per request.
+
     Args:
-        config_attr: Name of the attribute to store config on the function
+        config_type: Lifecycle type the decorator stores its config under
 
     Returns:
         Decorator function
     """
 
     def decorator(config: LifecycleConfig):
+        # Validate configuration once, however many endpoints it decorates
+        validate_config(config)
+
+        # Freeze a copy, as the precomputed headers would not follow later edits
+        config = MappingProxyType(dict(config))
+
         def wrapper(func: Callable) -> Callable:
-            # Validate configuration
-            validate_config(config)
+            global _DECORATED_COUNT
+            _DECORATED_COUNT += 1
+
+            # Stacked lifecycle decorators share the innermost wrapper
+            stacked = hasattr(func, "_lifecycle_headers_raw")
 
             # Store metadata on the function
-            setattr(func, config_attr, config)
+            configs = store_endpoint_config(func, config_type, config)
 
-            @wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                result = await func(*args, **kwargs)
-                return _handle_response_headers(result, args, kwargs, func)
+            # Precompute the encoded headers once instead of on every request
+            raw_headers = build_raw_headers(configs)
+            func._lifecycle_headers_raw = raw_headers or None
+            func._lifecycle_inject = (
+                build_header_injector(raw_headers) if raw_headers else None
+            )
+
+            if stacked:
+                return func
+
+            # Without a Response parameter only the middleware, route class or
+            # dependency can inject headers, so the endpoint needs no wrapper
+            response_param = _find_response_param(func)
+            if response_param is None:
+                return func
+
+            if inspect.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    result = await func(*args, **kwargs)
+                    _handle_response_headers(kwargs.get(response_param), async_wrapper)
+                    return result
+
+                return async_wrapper
 
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
                 result = func(*args, **kwargs)
-                return _handle_response_headers(result, args, kwargs, func)
+                _handle_response_headers(kwargs.get(response_param), sync_wrapper)
+                return result
 
-            # Return appropriate wrapper based on function type
-            return async_wrapper if inspect.iscoroutinefunction(func) else sync_wrapper
+            return sync_wrapper
 
         return wrapper
 
     return decorator
 
 
-def _handle_response_headers(
-    result: Any, args: tuple, kwargs: dict, func: Callable
-) -> Any:
+def _handle_response_headers(response: Any, func: Callable) -> None:
     """Handle header injection for decorated endpoints."""
-    # Find Response object in args/kwargs
-    response = _find_response_object(args, kwargs)
-
     if response is not None:
-        # Get all configs from the function and inject headers
-        configs = get_endpoint_configs(func)
-        for config in configs.values():
-            inject_headers(response, config)
+        inject = get_endpoint_injector(func)
+        if inject is not None:
+            inject(response)
 
-    return result
 
+def _find_response_param(func: Callable) -> Optional[str]:
+    """
+    Find the parameter FastAPI fills with the Response object.
 
-def _find_response_object(args: tuple, kwargs: dict):
-    """Find FastAPI Response object in function arguments."""
-    from fastapi import Response
+    FastAPI passes endpoint parameters by name, so the wrappers can read the
+    response straight from kwargs instead of scanning every argument.
+    """
     from starlette.responses import Response as StarletteResponse
 
-    # Check args
-    for arg in args:
-        if isinstance(arg, (Response, StarletteResponse)):
-            return arg
+    try:
+        hints = get_type_hints(func)
+    except Exception:
+        hints = {}
 
-    # Check kwargs
-    for value in kwargs.values():
-        if isinstance(value, (Response, StarletteResponse)):
-            return value
+    for name, param in inspect.signature(func).parameters.items():
+        annotation = hints.get(name, param.annotation)
+        if inspect.isclass(annotation) and issubclass(annotation, StarletteResponse):
+            return name
 
     return None
 
 
+# Lifecycle decorators built once by the shared factory
+_deprecated_decorator = _create_lifecycle_decorator("deprecated")
+_sunset_decorator = _create_lifecycle_decorator("sunset")
+_versioned_decorator = _create_lifecycle_decorator("versioned")
+
+
 def deprecated(config: LifecycleConfig):
     """
     Mark an endpoint as deprecated.
@@ -103,7 +150,7 @@ def deprecated(config: LifecycleConfig):
         async def get_users_v1():
             return {"users": []}
     """
-    return _create_lifecycle_decorator("_deprecated_config")(config)
+    return _deprecated_decorator(config)
 
 
 def sunset(config: LifecycleConfig):
@@ -127,7 +174,7 @@ def sunset(config: LifecycleConfig):
         async def old_endpoint():
             return {"data": "will be removed"}
     """
-    return _create_lifecycle_decorator("_sunset_config")(config)
+    return _sunset_decorator(config)
 
 
 def versioned(config: LifecycleConfig):
@@ -155,4 +202,4 @@ def versioned(config: LifecycleConfig):
         async def versioned_endpoint():
             return {"version": "1.0", "data": "value"}
     """
-    return _create_lifecycle_decorator("_versioned_config")(config)
+    return _versioned_decorator(config)
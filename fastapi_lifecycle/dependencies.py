@@ -1,34 +1,29 @@
 """FastAPI dependency functions for manual lifecycle management."""
 
-from typing import Callable, Optional
+from fastapi import Request, Response
 
-from fastapi import Response
+from .utils import get_endpoint_injector
 
-from .utils import inject_headers, get_endpoint_configs
 
-
-def inject_lifecycle_headers(
-    response: Response, endpoint_func: Optional[Callable] = None
-) -> None:
+def inject_lifecycle_headers(request: Request, response: Response) -> None:
     """
     FastAPI dependency to manually inject lifecycle headers.
 
     This approach gives you explicit control over when headers are injected
-    but requires manual addition to each endpoint.
+    but requires manual addition to each endpoint. The endpoint is resolved
+    from the route FastAPI matched for the request.
 
     Args:
+        request: Incoming HTTP request
         response: FastAPI Response object
-        endpoint_func: Endpoint function to extract configs from
 
     Example:
-        @app.get("/endpoint")
+        @app.get("/endpoint", dependencies=[Depends(inject_lifecycle_headers)])
         @deprecated({...})
-        async def endpoint(
-            response: Response = Depends(inject_lifecycle_headers)
-        ):
+        async def endpoint():
             return {"data": "value"}
     """
-    if endpoint_func:
-        configs = get_endpoint_configs(endpoint_func)
-        for config in configs.values():
-            inject_headers(response, config)
+    endpoint = getattr(request.scope.get("route"), "endpoint", None)
+    inject = get_endpoint_injector(endpoint)
+    if inject is not None:
+        inject(response)
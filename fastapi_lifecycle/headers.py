@@ -1,47 +1,131 @@
 """HTTP header utilities for API lifecycle management."""
 
-from datetime import datetime
+import sys
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from typing import Union
 
 from dateutil import parser
 
+# datetime.fromisoformat() accepts a trailing "Z" from Python 3.11 onwards
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Fixed English names used by the HTTP-date format (RFC 7231, section 7.1.1.1)
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+@lru_cache(maxsize=512)
+def format_http_date(dt: Union[datetime, date, str]) -> str:
+    """
+    Format datetime to RFC 7231 compliant HTTP date format.
+
+    Results are memoized: deployments only use a handful of distinct
+    deprecation and sunset timestamps, so the cache stays small while
+    skipping repeated parsing and rendering.
+
+    Args:
+        dt: Datetime, date or ISO 8601 string to format
+
+    Returns:
+        HTTP date string in format: "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    Examples:
+        >>> format_http_date("2024-01-15T00:00:00Z")
+        "Mon, 15 Jan 2024 00:00:00 GMT"
+    """
+    if isinstance(dt, str):
+        dt = _parse_iso_date(dt)
+    return _render_http_date(dt)
+
+
+def create_link_header(url: str, rel: str = "deprecation") -> str:
+    """
+    Create RFC 8288 compliant Link header value.
+
+    Args:
+        url: Target URL for the link
+        rel: Link relation type (default: "deprecation")
+
+    Returns:
+        Formatted Link header value
+
+    Examples:
+        >>> create_link_header("https://api.example.com/docs")
+        '<https://api.example.com/docs>; rel="deprecation"'
+    """
+    return f'<{url}>; rel="{rel}"'
+
 
 class VersioningHeaders:
-    """Utility class for managing versioning-related HTTP headers."""
-
-    @staticmethod
-    def format_http_date(dt: Union[datetime, str]) -> str:
-        """
-        Format datetime to RFC 7231 compliant HTTP date format.
-
-        Args:
-            dt: Datetime object or ISO 8601 string to format
-
-        Returns:
-            HTTP date string in format: "Wed, 21 Oct 2015 07:28:00 GMT"
-
-        Examples:
-            >>> VersioningHeaders.format_http_date("2024-01-15T00:00:00Z")
-            "Mon, 15 Jan 2024 00:00:00 GMT"
-        """
-        if isinstance(dt, str):
-            dt = parser.isoparse(dt.replace("Z", "+00:00"))
-        return dt.strftime("%a, %d %b %Y %H:%M:%S GMT")
-
-    @staticmethod
-    def create_link_header(url: str, rel: str = "deprecation") -> str:
-        """
-        Create RFC 8288 compliant Link header value.
-
-        Args:
-            url: Target URL for the link
-            rel: Link relation type (default: "deprecation")
-
-        Returns:
-            Formatted Link header value
-
-        Examples:
-            >>> VersioningHeaders.create_link_header("https://api.example.com/docs")
-            '<https://api.example.com/docs>; rel="deprecation"'
-        """
-        return f'<{url}>; rel="{rel}"'
+    """
+    Utility class for managing versioning-related HTTP headers.
+
+    Kept for backward compatibility; the module-level ``format_http_date``
+    and ``create_link_header`` functions avoid the extra class lookup.
+    """
+
+    format_http_date = staticmethod(format_http_date)
+    create_link_header = staticmethod(create_link_header)
+
+
+def _parse_iso_date(value: str) -> datetime:
+    """
+    Parse an ISO 8601 string, falling back to dateutil for non-strict inputs.
+
+    Args:
+        value: ISO 8601 date string
+
+    Returns:
+        Parsed datetime object
+    """
+    try:
+        if _FROMISOFORMAT_ACCEPTS_Z:
+            return datetime.fromisoformat(value)
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return parser.isoparse(value.replace("Z", "+00:00"))
+
+
+def _render_http_date(dt: Union[datetime, date]) -> str:
+    """
+    Render a datetime as an HTTP date without going through strftime.
+
+    Timezone-aware datetimes are converted to UTC first; naive datetimes are
+    assumed to already be in UTC. Plain dates are rendered as midnight.
+
+    Args:
+        dt: Datetime or date object to render
+
+    Returns:
+        HTTP date string
+
+    Raises:
+        TypeError: If dt is neither a datetime nor a date
+    """
+    if isinstance(dt, datetime):
+        if dt.tzinfo is not None:
+            dt = dt.astimezone(timezone.utc)
+        time = f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    elif isinstance(dt, date):
+        time = "00:00:00"
+    else:
+        raise TypeError(f"Expected datetime, date or str, got {type(dt).__name__}")
+    return (
+        f"{_DAYS[dt.weekday()]}, {dt.day:02d} {_MONTHS[dt.month - 1]} "
+        f"{dt.year:04d} {time} GMT"
+    )
+
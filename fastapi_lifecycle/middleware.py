@@ -1,44 +1,83 @@
 """Middleware for automatic lifecycle header injection."""
 
-from fastapi import FastAPI, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Dict, Optional, Sequence, Tuple
 
-from .utils import inject_headers, get_endpoint_configs
+from fastapi import FastAPI
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from . import decorators
+from .schemas import RawHeaders
+from .utils import get_endpoint_headers, merge_raw_headers
 
-class VersioningMiddleware(BaseHTTPMiddleware):
+
+class VersioningMiddleware:
     """
     Middleware to automatically inject lifecycle headers.
 
     This middleware examines each request's matched route and automatically
     injects appropriate lifecycle headers based on decorator metadata.
+
+    It is implemented as a plain ASGI middleware rather than on top of
+    ``BaseHTTPMiddleware``, so no task group or streaming bridge is created
+    per request; headers are added to the ``http.response.start`` message.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(
+        self, app: ASGIApp, routes: Optional[Sequence[BaseRoute]] = None
+    ) -> None:
         """
-        Process request and inject lifecycle headers in response.
+        Initialize the middleware.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/handler in chain
+            app: Next ASGI application in the chain
+            routes: Application routes to precompute lifecycle headers for.
+                Starlette builds the middleware stack at startup, so this
+                sees every route registered by then; other routes are looked
+                up per request.
+        """
+        self.app = app
+
+        # Keyed by id() as Starlette routes are unhashable; the route itself is
+        # kept to detect an id reused by a route created later
+        self._route_headers: Dict[int, Tuple[BaseRoute, Optional[RawHeaders]]] = {
+            id(route): (route, get_endpoint_headers(getattr(route, "endpoint", None)))
+            for route in routes or ()
+        }
 
-        Returns:
-            HTTP response with lifecycle headers injected
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process request and inject lifecycle headers in response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        response = await call_next(request)
+        # Pass through untouched when no endpoint has lifecycle metadata
+        if scope["type"] != "http" or not decorators._DECORATED_COUNT:
+            await self.app(scope, receive, send)
+            return
 
-        # Get the route from request scope (set by FastAPI during routing)
-        route = request.scope.get("route")
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Get the route from scope (set by FastAPI during routing)
+                route = scope.get("route")
+                entry = self._route_headers.get(id(route))
+                if entry is not None and entry[0] is route:
+                    raw_headers = entry[1]
+                else:
+                    raw_headers = get_endpoint_headers(getattr(route, "endpoint", None))
 
-        if route and hasattr(route, "endpoint"):
-            endpoint = route.endpoint
+                # Inject the headers precomputed at decoration time
+                if raw_headers is not None:
+                    message["headers"] = merge_raw_headers(
+                        message.get("headers", ()), raw_headers
+                    )
 
-            # Get all lifecycle configurations and inject headers
-            configs = get_endpoint_configs(endpoint)
-            for config in configs.values():
-                inject_headers(response, config)
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
 
 
 def setup_versioning(app: FastAPI, method: str = "middleware") -> None:
@@ -53,7 +92,7 @@ def setup_versioning(app: FastAPI, method: str = "middleware") -> None:
         ValueError: If invalid method specified
     """
     if method == "middleware":
-        app.add_middleware(VersioningMiddleware)
+        app.add_middleware(VersioningMiddleware, routes=app.router.routes)
     elif method == "route_class":
         from .route import LifecycleAPIRoute
 
@@ -1,13 +1,10 @@
 """Custom APIRoute implementation for lifecycle header injection."""
 
-from typing import Callable
-
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
-from starlette.requests import Request
-from starlette.responses import Response as StarletteResponse
+from starlette.types import Message, Receive, Scope, Send
 
-from .utils import inject_headers, get_endpoint_configs
+from .utils import get_endpoint_headers, merge_raw_headers
 
 
 class LifecycleAPIRoute(APIRoute):
@@ -16,30 +13,38 @@ class LifecycleAPIRoute(APIRoute):
 
     This approach provides the best performance as headers are injected
     directly during route handling without additional middleware overhead.
+    Headers are added to the ``http.response.start`` message, so streaming
+    responses are passed through without being buffered.
     """
 
-    def get_route_handler(self) -> Callable:
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Get route handler with automatic header injection.
+        Handle the request, injecting lifecycle headers into the response.
 
-        Returns:
-            Wrapped route handler function
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        original_route_handler = super().get_route_handler()
+        # Read per request, as lifecycle decorators applied above the route
+        # decorator only mark the endpoint after this route was created
+        raw_headers = get_endpoint_headers(self.endpoint)
 
-        async def custom_route_handler(request: Request) -> StarletteResponse:
-            """Custom route handler with header injection."""
-            response = await original_route_handler(request)
+        # Endpoints without lifecycle metadata are handled as usual
+        if raw_headers is None:
+            await super().handle(scope, receive, send)
+            return
 
-            # Inject headers based on endpoint lifecycle configurations
-            endpoint = self.endpoint
-            configs = get_endpoint_configs(endpoint)
-            for config in configs.values():
-                inject_headers(response, config)
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Inject the headers precomputed at decoration time
+                message["headers"] = merge_raw_headers(
+                    message.get("headers", ()), raw_headers
+                )
 
-            return response
+            await send(message)
 
-        return custom_route_handler
+        await super().handle(scope, receive, send_wrapper)
 
 
 def setup_versioning_with_route_class(app: FastAPI) -> None:
@@ -1,13 +1,16 @@
 """Type definitions for the fastapi-lifecycle package."""
 
-from datetime import datetime
-from typing import Dict, Any, Union
+from datetime import date, datetime
+from typing import Dict, Any, Tuple, Union
 
 # Configuration dictionary type for decorators
 LifecycleConfig = Dict[str, Any]
 
 # Supported date types
-DateType = Union[datetime, str]
+DateType = Union[datetime, date, str]
+
+# Pre-encoded (name, value) header pairs, as stored in ASGI/Starlette raw headers
+RawHeaders = Tuple[Tuple[bytes, bytes], ...]
 
 
 # Standard lifecycle configuration keys
@@ -1,79 +1,257 @@
 """Utility functions for header injection and configuration validation."""
 
-from typing import Union, Dict, Any
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Iterable, List, Mapping, Optional, Tuple
 
-from fastapi import Response
 from starlette.responses import Response as StarletteResponse
 
-from .headers import VersioningHeaders
-from .schemas import LifecycleConfig, ConfigKeys
+from .headers import format_http_date, create_link_header
+from .schemas import LifecycleConfig, ConfigKeys, RawHeaders
 
+# Config keys bound once at import instead of looked up on ConfigKeys per use
+_DEPRECATED_AT = ConfigKeys.DEPRECATED_AT
+_SUNSET_AT = ConfigKeys.SUNSET_AT
+_MIGRATION_URL = ConfigKeys.MIGRATION_URL
+_REPLACEMENT = ConfigKeys.REPLACEMENT
+_REASON = ConfigKeys.REASON
+_VERSION = ConfigKeys.VERSION
+_DATE_FIELDS = (_DEPRECATED_AT, _SUNSET_AT)
+_TEXT_FIELDS = (_MIGRATION_URL, _REPLACEMENT, _REASON, _VERSION)
 
-def inject_headers(
-    response: Union[Response, StarletteResponse], config: LifecycleConfig
-) -> None:
+# Lifecycle config types, in header precedence order, and their attributes
+_CONFIG_ATTRS = {
+    "deprecated": "_deprecated_config",
+    "sunset": "_sunset_config",
+    "versioned": "_versioned_config",
+}
+
+# Lifecycle header names; the same objects key the rendered and encoded headers
+_HDR_DEPRECATION = "Deprecation"
+_HDR_SUNSET = "Sunset"
+_HDR_LINK = "Link"
+_HDR_VERSION = "X-API-Version"
+_HDR_REPLACEMENT = "X-API-Replacement"
+_HDR_REASON = "X-API-Deprecation-Reason"
+
+# Encoded header names, lowercased as Starlette stores them; shared by the
+# precomputed headers of every endpoint
+_RAW_HEADER_NAMES = {
+    _HDR_DEPRECATION: b"deprecation",
+    _HDR_SUNSET: b"sunset",
+    _HDR_LINK: b"link",
+    _HDR_VERSION: b"x-api-version",
+    _HDR_REPLACEMENT: b"x-api-replacement",
+    _HDR_REASON: b"x-api-deprecation-reason",
+}
+
+# Shared read-only result for endpoints without lifecycle configs
+_EMPTY_CONFIGS: Mapping[str, LifecycleConfig] = MappingProxyType({})
+
+
+def build_headers(config: LifecycleConfig) -> Dict[str, str]:
     """
-    Inject lifecycle headers into HTTP response.
+    Render the lifecycle headers described by a configuration dictionary.
 
     Args:
-        response: FastAPI or Starlette response object
         config: Configuration dictionary with lifecycle metadata
+
+    Returns:
+        Dictionary mapping header names to their rendered values
     """
+    headers = {}
     if not config:
-        return
+        return headers
 
     # Add deprecation header (RFC 8594)
-    if config.get(ConfigKeys.DEPRECATED_AT):
-        response.headers["Deprecation"] = VersioningHeaders.format_http_date(
-            config[ConfigKeys.DEPRECATED_AT]
-        )
+    value = config.get(_DEPRECATED_AT)
+    if value is not None:
+        headers[_HDR_DEPRECATION] = format_http_date(value)
 
     # Add sunset header (RFC 8594)
-    if config.get(ConfigKeys.SUNSET_AT):
-        response.headers["Sunset"] = VersioningHeaders.format_http_date(
-            config[ConfigKeys.SUNSET_AT]
-        )
+    value = config.get(_SUNSET_AT)
+    if value is not None:
+        headers[_HDR_SUNSET] = format_http_date(value)
 
     # Add migration link (RFC 8288)
-    if config.get(ConfigKeys.MIGRATION_URL):
-        response.headers["Link"] = VersioningHeaders.create_link_header(
-            config[ConfigKeys.MIGRATION_URL]
-        )
+    value = config.get(_MIGRATION_URL)
+    if value is not None:
+        headers[_HDR_LINK] = create_link_header(value)
 
     # Add custom headers for additional metadata
-    if config.get(ConfigKeys.VERSION):
-        response.headers["X-API-Version"] = str(config[ConfigKeys.VERSION])
+    value = config.get(_VERSION)
+    if value is not None:
+        headers[_HDR_VERSION] = str(value)
+
+    value = config.get(_REPLACEMENT)
+    if value is not None:
+        headers[_HDR_REPLACEMENT] = str(value)
 
-    if config.get(ConfigKeys.REPLACEMENT):
-        response.headers["X-API-Replacement"] = str(config[ConfigKeys.REPLACEMENT])
+    value = config.get(_REASON)
+    if value is not None:
+        headers[_HDR_REASON] = str(value)
 
-    if config.get(ConfigKeys.REASON):
-        response.headers["X-API-Deprecation-Reason"] = str(config[ConfigKeys.REASON])
+    return headers
 
 
-def get_endpoint_configs(endpoint) -> Dict[str, LifecycleConfig]:
+def build_raw_headers(configs: Mapping[str, LifecycleConfig]) -> RawHeaders:
     """
-    Extract all lifecycle configurations from an endpoint function.
+    Precompute the encoded lifecycle headers for a set of configurations.
+
+    Later configurations override earlier ones for the same header, matching
+    the order in which the headers used to be assigned on the response.
+
+    Args:
+        configs: Dictionary mapping config types to their configurations
+
+    Returns:
+        Tuple of lowercased, latin-1 encoded (name, value) header pairs
+    """
+    headers: Dict[str, str] = {}
+    for config in configs.values():
+        headers.update(build_headers(config))
+
+    return tuple(
+        (_RAW_HEADER_NAMES[name], value.encode("latin-1"))
+        for name, value in headers.items()
+    )
+
+
+def merge_raw_headers(
+    headers: Iterable[Tuple[bytes, bytes]], raw_headers: RawHeaders
+) -> List[Tuple[bytes, bytes]]:
+    """
+    Combine ASGI message headers with precomputed lifecycle headers.
+
+    A new list is returned, as the current one may belong to a reused
+    Response object. If the lifecycle headers are already present, e.g.
+    because both the route class and the middleware are installed, the
+    headers are returned unchanged.
+
+    Args:
+        headers: Headers of an ``http.response.start`` message
+        raw_headers: Non-empty encoded header pairs built by ``build_raw_headers``
+
+    Returns:
+        Header list to send
+    """
+    headers = list(headers)
+    if raw_headers[0] not in headers:
+        headers.extend(raw_headers)
+    return headers
+
+
+def inject_headers(response: StarletteResponse, raw_headers: RawHeaders) -> None:
+    """
+    Inject precomputed lifecycle headers into HTTP response.
+
+    Called through the injector from ``build_header_injector``, which the
+    decorator wrappers and the dependency use and which may both handle the
+    same response; headers that are already present are not added again.
+    The middleware and route class use ``merge_raw_headers`` instead.
+
+    Args:
+        response: Starlette response object (FastAPI's Response is one)
+        raw_headers: Encoded header pairs built by ``build_raw_headers``
+    """
+    headers = response.raw_headers
+    if raw_headers and raw_headers[0] not in headers:
+        headers.extend(raw_headers)
+
+
+def build_header_injector(
+    raw_headers: RawHeaders,
+) -> Callable[[StarletteResponse], None]:
+    """
+    Build a function that injects a fixed set of precomputed headers.
+
+    The returned function is specialized for one endpoint: it holds the
+    encoded headers and passes them to ``inject_headers``.
+
+    Args:
+        raw_headers: Non-empty encoded header pairs built by ``build_raw_headers``
+
+    Returns:
+        Function taking a response object and injecting the headers into it
+    """
+
+    def inject(response: StarletteResponse) -> None:
+        inject_headers(response, raw_headers)
+
+    return inject
+
+
+def get_endpoint_injector(
+    endpoint,
+) -> Optional[Callable[[StarletteResponse], None]]:
+    """
+    Get the header injection function built for an endpoint function.
+
+    Args:
+        endpoint: FastAPI endpoint function
+
+    Returns:
+        Injection function, or None if the endpoint has no lifecycle headers
+    """
+    return getattr(endpoint, "_lifecycle_inject", None)
+
+
+def get_endpoint_headers(endpoint) -> Optional[RawHeaders]:
+    """
+    Get the precomputed lifecycle headers of an endpoint function.
+
+    This is a single attribute read, so callers can cheaply skip all header
+    work for endpoints without lifecycle metadata.
+
+    Args:
+        endpoint: FastAPI endpoint function
+
+    Returns:
+        Encoded header pairs, or None if the endpoint has no lifecycle headers
+    """
+    return getattr(endpoint, "_lifecycle_headers_raw", None)
+
+
+def store_endpoint_config(
+    endpoint, config_type: str, config: LifecycleConfig
+) -> Mapping[str, LifecycleConfig]:
+    """
+    Attach a lifecycle configuration to an endpoint function.
+
+    Besides the per-type attribute (e.g. ``_deprecated_config``), all
+    configurations are kept together in a single read-only
+    ``_lifecycle_configs`` attribute so they can be read back with one
+    attribute lookup.
 
     Args:
         endpoint: FastAPI endpoint function
+        config_type: Lifecycle type ("deprecated", "sunset" or "versioned")
+        config: Configuration dictionary to attach
 
     Returns:
-        Dictionary mapping config types to their configurations
+        Mapping of config types to their configurations
     """
-    configs = {}
+    setattr(endpoint, _CONFIG_ATTRS[config_type], config)
 
-    config_attrs = {
-        "deprecated": "_deprecated_config",
-        "sunset": "_sunset_config",
-        "versioned": "_versioned_config",
-    }
+    # Keep the canonical type order, which decides header precedence
+    configs = {**get_endpoint_configs(endpoint), config_type: config}
+    endpoint._lifecycle_configs = MappingProxyType(
+        {name: configs[name] for name in _CONFIG_ATTRS if name in configs}
+    )
+    return endpoint._lifecycle_configs
 
-    for config_type, attr_name in config_attrs.items():
-        if hasattr(endpoint, attr_name):
-            configs[config_type] = getattr(endpoint, attr_name)
 
-    return configs
+def get_endpoint_configs(endpoint) -> Mapping[str, LifecycleConfig]:
+    """
+    Extract all lifecycle configurations from an endpoint function.
+
+    Args:
+        endpoint: FastAPI endpoint function
+
+    Returns:
+        Mapping of config types to their configurations; a shared empty,
+        read-only mapping if the endpoint has none
+    """
+    return getattr(endpoint, "_lifecycle_configs", _EMPTY_CONFIGS)
 
 
 def validate_config(config: LifecycleConfig) -> None:
@@ -90,10 +268,17 @@ def validate_config(config: LifecycleConfig) -> None:
         raise ValueError("Configuration must be a dictionary")
 
     # Validate date fields if present
-    date_fields = [ConfigKeys.DEPRECATED_AT, ConfigKeys.SUNSET_AT]
-    for field in date_fields:
+    for field in _DATE_FIELDS:
         if field in config and config[field] is not None:
             try:
-                VersioningHeaders.format_http_date(config[field])
+                format_http_date(config[field])
             except (ValueError, TypeError) as e:
                 raise ValueError(f"Invalid date format for {field}: {e}")
+
+    # Header values are encoded as latin-1 when the decorator is applied
+    for field in _TEXT_FIELDS:
+        if field in config and config[field] is not None:
+            try:
+                str(config[field]).encode("latin-1")
+            except UnicodeEncodeError as e:
+                raise ValueError(f"Invalid header value for {field}: {e}")